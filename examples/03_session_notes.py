@@ -15,7 +15,7 @@ from mini_agent.agent import Agent
 from mini_agent.config import Config
 from mini_agent.llm import LLMClient
 from mini_agent.tools import BashTool, ReadTool, WriteTool
-from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool
+from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool, load_notes
 
 
 async def demo_direct_note_usage():
@@ -66,7 +66,7 @@ async def demo_direct_note_usage():
         # Show the memory file
         print("\n📄 Memory file content:")
         print("=" * 60)
-        notes = json.loads(Path(note_file).read_text())
+        notes = load_notes(Path(note_file))
         print(json.dumps(notes, indent=2, ensure_ascii=False))
         print("=" * 60)
 
@@ -176,7 +176,7 @@ Guidelines:
 
             # Check memory file
             if memory_file.exists():
-                notes = json.loads(memory_file.read_text())
+                notes = load_notes(memory_file)
                 print(f"\n✅ Agent recorded {len(notes)} notes in memory")
                 for note in notes:
                     print(f"  - [{note['category']}] {note['content'][:50]}...")
@@ -18,7 +18,7 @@ from mini_agent.config import Config
 from mini_agent.llm import LLMClient
 from mini_agent.tools import BashTool, EditTool, ReadTool, WriteTool
 from mini_agent.tools.mcp_loader import load_mcp_tools_async
-from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool
+from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool, load_notes
 
 
 async def demo_full_agent():
@@ -169,9 +169,7 @@ You have record_note and recall_notes tools. Use them to:
 
             # Show memory
             if memory_file.exists():
-                import json
-
-                notes = json.loads(memory_file.read_text())
+                notes = load_notes(memory_file)
                 print(f"\n💾 Session notes recorded: {len(notes)}")
                 for note in notes:
                     print(f"  - [{note['category']}] {note['content'][:60]}...")
@@ -261,6 +261,9 @@ Requirements:
         self.logger.start_new_run()
         print(f"{Colors.DIM}📝 Log file: {self.logger.get_log_file_path()}{Colors.RESET}")
 
+        # Tool set is fixed for the duration of a run, so build schemas once rather than every step
+        tool_schemas = [tool.to_schema() for tool in self.tools.values()]
+
         step = 0
 
         while step < self.max_steps:
@@ -274,9 +277,6 @@ Requirements:
             )
             print(f"{Colors.DIM}╰{'─' * 58}╯{Colors.RESET}")
 
-            # Get tool schemas
-            tool_schemas = [tool.to_schema() for tool in self.tools.values()]
-
             # Log LLM request
             self.logger.log_request(messages=self.messages, tools=tool_schemas)
 
@@ -11,6 +11,14 @@ from .schema import FunctionCall, LLMResponse, Message, ToolCall
 
 logger = logging.getLogger(__name__)
 
+# Optional HTTP/2 support (requires the h2 package)
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class LLMClient:
     """MiniMax M2 LLM Client via Anthropic-compatible endpoint.
@@ -34,6 +42,25 @@ class LLMClient:
         # Callback for tracking retry count
         self.retry_callback = None
 
+        # Shared HTTP client, created on first request and reused so TCP/TLS connections stay alive
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def _make_api_request(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Execute API request (core method that can be retried)
 
@@ -46,18 +73,17 @@ class LLMClient:
         Raises:
             Exception: API call failed
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{self.api_base}/v1/messages",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "anthropic-version": "2023-06-01",
-                },
-                json=payload,
-            )
+        response = await self._get_client().post(
+            f"{self.api_base}/v1/messages",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "anthropic-version": "2023-06-01",
+            },
+            json=payload,
+        )
 
-            result = response.json()
+        result = response.json()
 
         # Check for errors (Anthropic format)
         if result.get("type") == "error":
@@ -4,28 +4,97 @@ Agent Loader - Load Sub-Agents
 Supports loading agent definitions from *.md files with YAML frontmatter
 """
 
-import re
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# Discovery parses files in a thread pool once more than this many need loading
+_PARALLEL_LOAD_THRESHOLD = 4
+_MAX_LOAD_WORKERS = 8
+
+# Frontmatter is read in chunks of this size until the closing delimiter is found
+_READ_CHUNK_SIZE = 4096
+
+# Files larger than this are read through mmap instead of a buffered read
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=32)
+def _read_text(path_str: str, mtime_ns: int, size: int, offset: int) -> str:
+    """Read and decode a file from a byte offset (cache key includes mtime and size)"""
+    with open(path_str, "rb") as f:
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[offset:].decode("utf-8")
+        f.seek(offset)
+        return f.read().decode("utf-8")
+
+
+def read_text_cached(path: Path, offset: int = 0) -> str:
+    """
+    Read a UTF-8 text file, skipping re-reads while the file is unchanged
+
+    Args:
+        path: File path
+        offset: Byte offset to start reading from
+
+    Returns:
+        Decoded file content from offset to end of file
+    """
+    stat = path.stat()
+    return _read_text(str(path), stat.st_mtime_ns, stat.st_size, offset)
+
+
+def _read_frontmatter(agent_path: Path) -> Optional[Tuple[str, int]]:
+    """
+    Read only the YAML frontmatter header of an agent file
+
+    Args:
+        agent_path: Agent markdown file path
+
+    Returns:
+        Tuple of (frontmatter text, byte offset of the prompt body), or None if missing
+    """
+    buffer = b""
+    with open(agent_path, "rb") as f:
+        while True:
+            chunk = f.read(_READ_CHUNK_SIZE)
+            buffer += chunk
+            if not buffer.startswith(b"---\n"):
+                return None
+            end = buffer.find(b"\n---\n", 4)
+            if end != -1:
+                return buffer[4:end].decode("utf-8"), end + 5
+            if not chunk:
+                return None
+
 
 @dataclass
-class AgentDefinition:
-    """Agent definition data structure"""
+class AgentMetadata:
+    """Agent metadata parsed from YAML frontmatter"""
 
     name: str
     description: str
-    prompt: str
     tools: Optional[List[str]] = None  # Optional: restrict to specific tools
     skills: Optional[List[str]] = None  # Optional: restrict to specific skills
     max_steps: Optional[int] = None  # Optional: custom step limit
     agent_path: Optional[Path] = None
 
-    def to_metadata(self) -> str:
-        """Convert agent to metadata format for system prompt"""
+    @cached_property
+    def metadata(self) -> str:
+        """Metadata line for system prompt (computed once, fields are fixed after load)"""
         metadata = f"- `{self.name}`: {self.description}"
         if self.tools:
             metadata += f" (tools: {', '.join(self.tools)})"
@@ -35,10 +104,69 @@ class AgentDefinition:
             metadata += f" (max_steps: {self.max_steps})"
         return metadata
 
+    def to_metadata(self) -> str:
+        """Convert agent to metadata format for system prompt"""
+        return self.metadata
+
+
+class AgentDefinition(AgentMetadata):
+    """Agent definition data structure
+
+    The prompt body is read from agent_path on first access unless given explicitly.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        prompt: Optional[str] = None,
+        tools: Optional[List[str]] = None,
+        skills: Optional[List[str]] = None,
+        max_steps: Optional[int] = None,
+        agent_path: Optional[Path] = None,
+        body_offset: int = 0,
+        mtime_ns: Optional[int] = None,
+    ):
+        super().__init__(
+            name=name,
+            description=description,
+            tools=tools,
+            skills=skills,
+            max_steps=max_steps,
+            agent_path=agent_path,
+        )
+        self._prompt = prompt
+        # Body offset is only valid for the file version it was measured on
+        self._body_offset = body_offset
+        self._mtime_ns = mtime_ns
+
+    @property
+    def prompt(self) -> str:
+        """Agent prompt body (lazily loaded)"""
+        if self._prompt is None:
+            if self.agent_path is None:
+                self._prompt = ""
+            else:
+                offset = self._body_offset
+                if self._mtime_ns is not None and self.agent_path.stat().st_mtime_ns != self._mtime_ns:
+                    # File was edited since discovery, so locate the body again
+                    header = _read_frontmatter(self.agent_path)
+                    offset = header[1] if header is not None else 0
+                self._prompt = read_text_cached(self.agent_path, offset).strip()
+        return self._prompt
+
 
 class AgentLoader:
     """Agent loader for discovering and loading sub-agents"""
 
+    # Fixed introduction placed before the per-agent metadata lines
+    _HEADER = (
+        "## Available Sub-Agents\n\n"
+        "You have access to specialized sub-agents. Each sub-agent is an independent agent "
+        "with its own context and capabilities, designed for specific tasks.\n\n"
+        "Call a sub-agent using the `call_agent` tool when you need specialized assistance.\n"
+    )
+
     def __init__(self, agents_dir: str = "agents"):
         """
         Initialize Agent Loader
@@ -48,11 +176,18 @@ class AgentLoader:
         """
         self.agents_dir = Path(agents_dir)
         self.loaded_agents: Dict[str, AgentDefinition] = {}
+        # Parsed agent files keyed by path, tagged with the mtime they were parsed at
+        self._cache: Dict[Path, Tuple[int, Optional[AgentDefinition]]] = {}
+        # Bumped whenever loaded_agents changes, so dependents can invalidate their caches
+        self._version = 0
+        self._metadata_prompt: Optional[str] = None
 
     def load_agent(self, agent_path: Path) -> Optional[AgentDefinition]:
         """
         Load single agent from *.md file with YAML frontmatter
 
+        Results are cached by file mtime, so unchanged files are not re-parsed.
+
         Args:
             agent_path: Agent markdown file path
 
@@ -60,21 +195,49 @@ class AgentLoader:
             AgentDefinition object, or None if loading fails
         """
         try:
-            content = agent_path.read_text(encoding="utf-8")
+            mtime = agent_path.stat().st_mtime_ns
+        except OSError as e:
+            print(f"❌ Failed to load agent ({agent_path}): {e}")
+            return None
+
+        cached = self._cache.get(agent_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        agent = self._parse_agent(agent_path, mtime)
+        self._cache[agent_path] = (mtime, agent)
+        return agent
+
+    def _parse_agent(self, agent_path: Path, mtime_ns: Optional[int] = None) -> Optional[AgentDefinition]:
+        """
+        Parse single agent file (uncached)
 
-            # Parse YAML frontmatter
-            frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+        Args:
+            agent_path: Agent markdown file path
+            mtime_ns: File mtime the parse corresponds to (used to detect later edits)
 
-            if not frontmatter_match:
+        Returns:
+            AgentDefinition object, or None if parsing fails
+        """
+        try:
+            # Read only the YAML frontmatter; the prompt body is loaded on demand
+            header = _read_frontmatter(agent_path)
+
+            if header is None:
                 print(f"⚠️  {agent_path} missing YAML frontmatter")
                 return None
 
-            frontmatter_text = frontmatter_match.group(1)
-            agent_prompt = frontmatter_match.group(2).strip()
+            frontmatter_text, body_offset = header
+
+            # Cheap pre-check so files that cannot contain the required keys skip YAML parsing
+            # (bare words only, so quoted keys or "name :" still reach the full parse)
+            if "name" not in frontmatter_text or "description" not in frontmatter_text:
+                print(f"⚠️  {agent_path} missing required fields (name or description)")
+                return None
 
             # Parse YAML
             try:
-                frontmatter = yaml.safe_load(frontmatter_text)
+                frontmatter = yaml.load(frontmatter_text, Loader=_Loader)
             except yaml.YAMLError as e:
                 print(f"❌ Failed to parse YAML frontmatter in {agent_path}: {e}")
                 return None
@@ -88,11 +251,12 @@ class AgentLoader:
             agent = AgentDefinition(
                 name=frontmatter["name"],
                 description=frontmatter["description"],
-                prompt=agent_prompt,
                 tools=frontmatter.get("tools"),
                 skills=frontmatter.get("skills"),
                 max_steps=frontmatter.get("max_steps"),
                 agent_path=agent_path,
+                body_offset=body_offset,
+                mtime_ns=mtime_ns,
             )
 
             return agent
@@ -114,12 +278,50 @@ class AgentLoader:
             print(f"⚠️  Agents directory does not exist: {self.agents_dir}")
             return agents
 
-        # Find all *.md files in agents directory (non-recursive)
-        for agent_file in self.agents_dir.glob("*.md"):
-            agent = self.load_agent(agent_file)
+        # Find all *.md files in agents directory (non-recursive); DirEntry caches stat info
+        mtimes: Dict[Path, int] = {}
+        with os.scandir(self.agents_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    mtimes[Path(entry.path)] = entry.stat().st_mtime_ns
+        agent_files = list(mtimes)
+
+        # Only files that are new or changed since the last discovery need loading
+        changed_files = [
+            agent_file
+            for agent_file in agent_files
+            if agent_file not in self._cache or self._cache[agent_file][0] != mtimes[agent_file]
+        ]
+        if len(changed_files) > _PARALLEL_LOAD_THRESHOLD:
+            # File reads and libyaml parsing release the GIL, so threads overlap them
+            with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(changed_files))) as executor:
+                parsed = list(executor.map(self.load_agent, changed_files))
+        else:
+            parsed = [self.load_agent(agent_file) for agent_file in changed_files]
+
+        loaded = dict(zip(changed_files, parsed))
+
+        for agent_file in agent_files:
+            agent = loaded[agent_file] if agent_file in loaded else self._cache[agent_file][1]
             if agent:
                 agents.append(agent)
+
+        # Directory listing order is filesystem-dependent; sort so registration order is stable
+        agents.sort(key=lambda agent: agent.name)
+
+        changed = False
+        for agent in agents:
+            if self.loaded_agents.get(agent.name) is not agent:
                 self.loaded_agents[agent.name] = agent
+                changed = True
+
+        if changed:
+            self._version += 1
+            self._metadata_prompt = None
+
+        # Drop cache entries for files that no longer exist
+        for stale_path in self._cache.keys() - mtimes.keys():
+            del self._cache[stale_path]
 
         return agents
 
@@ -155,15 +357,11 @@ class AgentLoader:
         if not self.loaded_agents:
             return ""
 
-        prompt_parts = ["## Available Sub-Agents\n"]
-        prompt_parts.append(
-            "You have access to specialized sub-agents. Each sub-agent is an independent agent "
-            "with its own context and capabilities, designed for specific tasks.\n"
-        )
-        prompt_parts.append("Call a sub-agent using the `call_agent` tool when you need specialized assistance.\n")
+        if self._metadata_prompt is not None:
+            return self._metadata_prompt
 
-        # List all agents with their metadata
-        for agent in self.loaded_agents.values():
-            prompt_parts.append(agent.to_metadata())
-
-        return "\n".join(prompt_parts)
+        # Header followed by one metadata line per agent
+        self._metadata_prompt = f"{self._HEADER}\n" + "\n".join(
+            agent.metadata for agent in self.loaded_agents.values()
+        )
+        return self._metadata_prompt
@@ -2,13 +2,70 @@
 Call Agent Tool - Invoke sub-agents for specialized tasks
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..agent import Agent
 from ..llm import LLMClient
 from .agent_loader import AgentDefinition, AgentLoader
 from .base import Tool, ToolResult
+from .note_tool import SessionNoteTool
+
+# Agent-calling tools are never available to sub-agents, and the main agent's
+# record_note is replaced with an isolated per-sub-agent version
+_EXCLUDED_TOOL_NAMES = frozenset({"call_agent", "call_agents_parallel", "record_note"})
+
+# Successful sub-agent results kept for repeated (agent_name, task) calls
+_RESULT_CACHE_SIZE = 32
+
+# Tasks containing this marker always run the sub-agent instead of reusing a cached result
+FRESH_MARKER = "[[fresh]]"
+
+# Schema description of the task argument, shared by the agent-calling tools
+_TASK_DESCRIPTION = "The task description to send to the sub-agent. Be specific and clear."
+_TASK_CACHE_NOTE = f" Identical repeated tasks reuse the earlier result; include {FRESH_MARKER} to force a new run."
+
+
+class SubAgentResultCache:
+    """LRU cache of successful sub-agent results
+
+    Share one instance between agent-calling tools (e.g. call_agent and
+    call_agents_parallel) so a repeat through either tool reuses the result.
+    """
+
+    def __init__(self, maxsize: int = _RESULT_CACHE_SIZE):
+        """
+        Initialize Sub-Agent Result Cache
+
+        Args:
+            maxsize: Maximum number of results kept
+        """
+        self.maxsize = maxsize
+        # Results keyed by (agent_name, task digest), tagged with the agent loader version
+        self._entries: OrderedDict[Tuple[str, str], Tuple[int, ToolResult]] = OrderedDict()
+
+    @staticmethod
+    def make_key(agent_name: str, task: str) -> Tuple[str, str]:
+        """Build the cache key for an (agent_name, task) call"""
+        return agent_name, hashlib.blake2b(task.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: Tuple[str, str], version: int) -> Optional[ToolResult]:
+        """Get a cached result, ignoring entries stored under another loader version"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Tuple[str, str], version: int, result: ToolResult):
+        """Store a result, evicting the least recently used entry when full"""
+        self._entries[key] = (version, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
 
 
 class CallAgentTool(Tool):
@@ -22,6 +79,7 @@ class CallAgentTool(Tool):
         workspace_dir: str,
         call_depth: int = 0,
         max_depth: int = 1,
+        result_cache: Optional[SubAgentResultCache] = None,
     ):
         """
         Initialize Call Agent Tool
@@ -29,47 +87,88 @@ class CallAgentTool(Tool):
         Args:
             agent_loader: AgentLoader instance with discovered agents
             llm_client: LLM client for sub-agent
-            all_tools: List of all available tools (for filtering)
+            all_tools: List of all available tools (for filtering, indexed at construction)
             workspace_dir: Workspace directory (shared with main agent)
             call_depth: Current call depth (0 = main agent, 1 = sub-agent)
             max_depth: Maximum allowed call depth
+            result_cache: Optional cache for repeated sub-agent calls (None disables caching;
+                pass the same instance to share it between tools)
         """
         self.agent_loader = agent_loader
         self.llm_client = llm_client
         self.all_tools = all_tools
+        # Index tools by name once so per-call filtering is a dict lookup per allowed name
+        self._tools_by_name: Dict[str, Tool] = {tool.name: tool for tool in all_tools}
+        self._default_tools = [
+            tool for name, tool in self._tools_by_name.items() if name not in _EXCLUDED_TOOL_NAMES
+        ]
         self.workspace_dir = workspace_dir
         self.call_depth = call_depth
         self.max_depth = max_depth
 
+        # Isolated session note tools, reused across calls to the same sub-agent
+        self._note_tools: Dict[str, SessionNoteTool] = {}
+
+        # Schema/description caches, rebuilt when the agent loader's version changes
+        self._params_cache: Optional[dict] = None
+        self._params_version = -1
+        self._description_cache: Optional[str] = None
+        self._description_version = -1
+
+        # Recent successful sub-agent results (opt-in: workspace-changing tasks must not go stale)
+        self.result_cache = result_cache
+
     @property
     def name(self) -> str:
         return "call_agent"
 
     @property
     def description(self) -> str:
-        agents = self.agent_loader.list_agents()
-        agent_list = ", ".join(agents) if agents else "none"
-        return f"Invoke a specialized sub-agent to handle a specific task. Available agents: {agent_list}"
+        version = self.agent_loader._version
+        if self._description_cache is not None and self._description_version == version:
+            return self._description_cache
+
+        self._description_cache = self._build_description(self.agent_loader.list_agents())
+        self._description_version = version
+        return self._description_cache
 
     @property
     def parameters(self) -> dict:
-        agents = self.agent_loader.list_agents()
+        version = self.agent_loader._version
+        if self._params_cache is not None and self._params_version == version:
+            return self._params_cache
+
+        self._params_cache = self._build_parameters(self.agent_loader.list_agents())
+        self._params_version = version
+        return self._params_cache
+
+    def _build_description(self, agents: List[str]) -> str:
+        """Build the tool description for the given agent names"""
+        agent_list = ", ".join(agents) if agents else "none"
+        return f"Invoke a specialized sub-agent to handle a specific task. Available agents: {agent_list}"
+
+    def _build_parameters(self, agents: List[str]) -> dict:
+        """Build the parameters schema for the given agent names"""
         return {
             "type": "object",
-            "properties": {
-                "agent_name": {
-                    "type": "string",
-                    "description": f"Name of the agent to invoke. Available: {', '.join(agents) if agents else 'none'}",
-                    "enum": agents if agents else [],
-                },
-                "task": {
-                    "type": "string",
-                    "description": "The task description to send to the sub-agent. Be specific and clear.",
-                },
-            },
+            "properties": self._call_properties(agents),
             "required": ["agent_name", "task"],
         }
 
+    def _call_properties(self, agents: List[str]) -> dict:
+        """Schema properties of a single (agent_name, task) invocation"""
+        return {
+            "agent_name": {
+                "type": "string",
+                "description": f"Name of the agent to invoke. Available: {', '.join(agents) if agents else 'none'}",
+                "enum": agents if agents else [],
+            },
+            "task": {
+                "type": "string",
+                "description": _TASK_DESCRIPTION + (_TASK_CACHE_NOTE if self.result_cache is not None else ""),
+            },
+        }
+
     def _filter_tools(self, agent_def: AgentDefinition, sub_agent_name: str) -> List[Tool]:
         """
         Filter tools based on agent definition and create isolated session note tool
@@ -81,31 +180,27 @@ class CallAgentTool(Tool):
         Returns:
             Filtered list of tools
         """
-        # If no restriction specified, use all tools except call_agent and record_note
         if not agent_def.tools:
+            # No restriction specified, use all tools except the excluded ones
+            base_tools = list(self._default_tools)
+        else:
+            # Filter to only allowed tools (deduplicated, in definition order)
             base_tools = [
-                tool for tool in self.all_tools 
-                if tool.name not in ["call_agent", "record_note"]
+                self._tools_by_name[tool_name]
+                for tool_name in dict.fromkeys(agent_def.tools)
+                if tool_name in self._tools_by_name and tool_name not in _EXCLUDED_TOOL_NAMES
             ]
-        else:
-            # Filter to only allowed tools
-            allowed_tool_names = set(agent_def.tools)
-            base_tools = [tool for tool in self.all_tools if tool.name in allowed_tool_names]
-            
-            # Ensure call_agent is never available to sub-agents
-            base_tools = [tool for tool in base_tools if tool.name != "call_agent"]
-            
-            # Remove main agent's record_note to replace with isolated version
-            base_tools = [tool for tool in base_tools if tool.name != "record_note"]
-        
+
         # Add isolated session note tool for sub-agent if needed
         # Check if record_note was in the allowed tools or unrestricted
         should_have_notes = (not agent_def.tools) or ("record_note" in agent_def.tools)
         if should_have_notes:
-            from .note_tool import SessionNoteTool
-            isolated_note_tool = SessionNoteTool(
-                memory_file=str(Path(self.workspace_dir) / f".agent_memory_{sub_agent_name}.json")
-            )
+            isolated_note_tool = self._note_tools.get(sub_agent_name)
+            if isolated_note_tool is None:
+                isolated_note_tool = SessionNoteTool(
+                    memory_file=str(Path(self.workspace_dir) / f".agent_memory_{sub_agent_name}.json")
+                )
+                self._note_tools[sub_agent_name] = isolated_note_tool
             base_tools.append(isolated_note_tool)
         
         return base_tools
@@ -152,6 +247,17 @@ class CallAgentTool(Tool):
                 error=f"Agent '{agent_name}' not found. Available agents: {available}",
             )
 
+        # Reuse the result of an identical recent call unless a fresh run is requested
+        fresh = FRESH_MARKER in task
+        if fresh:
+            task = task.replace(FRESH_MARKER, "").strip()
+        cache_key = SubAgentResultCache.make_key(agent_name, task)
+        version = self.agent_loader._version
+        use_cache = self.result_cache is not None
+        cached = self.result_cache.get(cache_key, version) if use_cache and not fresh else None
+        if cached is not None:
+            return ToolResult(success=True, content="[cached] " + cached.content)
+
         try:
             # Filter tools based on agent configuration (with isolated session notes)
             agent_tools = self._filter_tools(agent_def, agent_name)
@@ -186,14 +292,87 @@ class CallAgentTool(Tool):
             # Run the sub-agent
             result = await sub_agent.run()
 
-            # Return the sub-agent's final response
-            return ToolResult(
+            # Return the sub-agent's final response (single join, result may be large)
+            tool_result = ToolResult(
                 success=True,
-                content=f"Sub-agent '{agent_name}' completed task.\n\nResult:\n{result}",
+                content="".join(("Sub-agent '", agent_name, "' completed task.\n\nResult:\n", result)),
             )
 
+            # Agent.run reports LLM failures and step exhaustion as plain strings, so only cache
+            # runs that actually finished with a final assistant answer
+            last_message = sub_agent.messages[-1]
+            if use_cache and last_message.role == "assistant" and not last_message.tool_calls:
+                self.result_cache.put(cache_key, version, tool_result)
+
+            return tool_result
+
         except Exception as e:
             return ToolResult(
                 success=False,
                 error=f"Failed to execute sub-agent '{agent_name}': {str(e)}",
             )
+
+
+class CallAgentsParallelTool(CallAgentTool):
+    """Tool for invoking several independent sub-agents concurrently"""
+
+    @property
+    def name(self) -> str:
+        return "call_agents_parallel"
+
+    def _build_description(self, agents: List[str]) -> str:
+        agent_list = ", ".join(agents) if agents else "none"
+        return (
+            "Invoke multiple sub-agents concurrently, one task each. Use this instead of several "
+            f"call_agent calls when the tasks are independent. Available agents: {agent_list}"
+        )
+
+    def _build_parameters(self, agents: List[str]) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "specs": {
+                    "type": "array",
+                    "description": "Independent sub-agent invocations to run concurrently",
+                    "items": {
+                        "type": "object",
+                        "properties": self._call_properties(agents),
+                        "required": ["agent_name", "task"],
+                    },
+                },
+            },
+            "required": ["specs"],
+        }
+
+    async def execute(self, specs: List[dict]) -> ToolResult:
+        """
+        Execute sub-agents concurrently, each in its own isolated context
+
+        Args:
+            specs: List of {"agent_name": ..., "task": ...} invocations
+
+        Returns:
+            ToolResult with every sub-agent's response (or error), in request order
+        """
+        if not specs:
+            return ToolResult(success=False, error="No sub-agent invocations specified")
+
+        call_agent = super().execute
+        results = await asyncio.gather(
+            *(call_agent(agent_name=spec.get("agent_name", ""), task=spec.get("task", "")) for spec in specs),
+            return_exceptions=True,
+        )
+
+        sections = []
+        any_success = False
+        for spec, result in zip(specs, results):
+            if isinstance(result, BaseException):
+                result = ToolResult(success=False, error=f"Failed to execute sub-agent: {result}")
+            any_success = any_success or result.success
+            body = result.content if result.success else f"Error: {result.error}"
+            sections.append(f"## {spec.get('agent_name', '')}\n\n{body}")
+
+        combined = "\n\n".join(sections)
+        if not any_success:
+            return ToolResult(success=False, error=combined)
+        return ToolResult(success=True, content=combined)
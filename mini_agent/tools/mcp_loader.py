@@ -1,6 +1,9 @@
 """MCP tool loader with real MCP client integration."""
 
+import asyncio
 import json
+import os
+import traceback
 from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any
@@ -8,6 +11,12 @@ from typing import Any
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Optional fast JSON parser (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Optional imports for URL-based transports
 try:
     from mcp.client.sse import sse_client
@@ -25,6 +34,9 @@ except ImportError:
 
 from .base import Tool, ToolResult
 
+# Full tracebacks for MCP failures are only printed when MINI_AGENT_DEBUG=1
+_DEBUG = os.environ.get("MINI_AGENT_DEBUG") == "1"
+
 
 class MCPTool(Tool):
     """Wrapper for MCP tools."""
@@ -216,8 +228,8 @@ class MCPServerConnection:
             if self.exit_stack:
                 await self.exit_stack.aclose()
                 self.exit_stack = None
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
             return False
 
     async def disconnect(self):
@@ -243,6 +255,15 @@ class MCPServerConnection:
 _mcp_connections: list[MCPServerConnection] = []
 
 
+async def _connect_server(connection: MCPServerConnection) -> bool:
+    """Connect a single server, reporting unexpected errors against its name."""
+    try:
+        return await connection.connect()
+    except Exception as e:
+        print(f"✗ Failed to connect to MCP server '{connection.name}' ({connection.transport}): {e}")
+        return False
+
+
 async def load_mcp_tools_async(config_path: str = "mcp.json") -> list[Tool]:
     """
     Load MCP tools from config file.
@@ -289,8 +310,10 @@ async def load_mcp_tools_async(config_path: str = "mcp.json") -> list[Tool]:
         return []
 
     try:
-        with open(config_file, encoding="utf-8") as f:
-            config = json.load(f)
+        # Parse raw bytes directly to skip the intermediate text decode
+        with open(config_file, "rb") as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
 
         mcp_servers = config.get("mcpServers", {})
 
@@ -299,8 +322,9 @@ async def load_mcp_tools_async(config_path: str = "mcp.json") -> list[Tool]:
             return []
 
         all_tools = []
+        connections: list[MCPServerConnection] = []
 
-        # Connect to each enabled server
+        # Build a connection for each enabled server
         for server_name, server_config in mcp_servers.items():
             if server_config.get("disabled", False):
                 print(f"Skipping disabled server: {server_name}")
@@ -325,18 +349,26 @@ async def load_mcp_tools_async(config_path: str = "mcp.json") -> list[Tool]:
                 print(f"⚠️  No URL specified for {transport} server: {server_name}")
                 continue
 
-            connection = MCPServerConnection(
-                name=server_name,
-                transport=transport,
-                command=command,
-                args=args,
-                env=env,
-                url=url,
-                headers=headers,
+            connections.append(
+                MCPServerConnection(
+                    name=server_name,
+                    transport=transport,
+                    command=command,
+                    args=args,
+                    env=env,
+                    url=url,
+                    headers=headers,
+                )
             )
-            success = await connection.connect()
 
-            if success:
+        # Connect to all servers concurrently (wall time is the slowest server, not the sum)
+        results = await asyncio.gather(
+            *(_connect_server(connection) for connection in connections),
+            return_exceptions=True,
+        )
+
+        for connection, success in zip(connections, results):
+            if success is True:
                 _mcp_connections.append(connection)
                 all_tools.extend(connection.tools)
 
@@ -346,8 +378,8 @@ async def load_mcp_tools_async(config_path: str = "mcp.json") -> list[Tool]:
 
     except Exception as e:
         print(f"Error loading MCP config: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            traceback.print_exc()
         return []
 
 
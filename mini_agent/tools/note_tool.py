@@ -13,6 +13,36 @@ from typing import Any
 
 from .base import Tool, ToolResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_line(note: dict) -> bytes:
+    """Serialize a note as a single newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(note, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(note, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def load_notes(memory_file: Path) -> list:
+    """Load notes from a memory file.
+
+    Notes are stored as JSON Lines (one note per line). Files written in the
+    older format, a single JSON array, are still read.
+
+    Returns empty list if file doesn't exist.
+    """
+    if not memory_file.exists():
+        return []
+
+    data = memory_file.read_bytes()
+    loads = orjson.loads if orjson is not None else json.loads
+    if data.lstrip().startswith(b"["):
+        return loads(data)
+    return [loads(line) for line in data.splitlines() if line.strip()]
+
 
 class SessionNoteTool(Tool):
     """Tool for recording and recalling session notes.
@@ -66,27 +96,31 @@ class SessionNoteTool(Tool):
             "required": ["content"],
         }
 
-    def _load_from_file(self) -> list:
-        """Load notes from file.
-        
-        Returns empty list if file doesn't exist (lazy loading).
-        """
-        if not self.memory_file.exists():
-            return []
-        
-        try:
-            return json.loads(self.memory_file.read_text())
-        except Exception:
-            return []
-
-    def _save_to_file(self, notes: list):
-        """Save notes to file.
-        
-        Creates parent directory and file if they don't exist (lazy initialization).
+    def _append_to_file(self, note: dict):
+        """Append a note to file.
+
+        Writes are append-only, so recording a note costs O(1) regardless of how
+        many notes exist. A file in the older JSON array format is rewritten as
+        JSON Lines on the first append. Creates parent directory and file if they
+        don't exist (lazy initialization).
         """
         # Ensure parent directory exists when actually saving
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
-        self.memory_file.write_text(json.dumps(notes, indent=2, ensure_ascii=False))
+
+        legacy_notes = None
+        if self.memory_file.exists():
+            with open(self.memory_file, "rb") as f:
+                if f.read(64).lstrip().startswith(b"["):
+                    try:
+                        legacy_notes = load_notes(self.memory_file)
+                    except Exception:
+                        legacy_notes = []
+
+        if legacy_notes is not None:
+            self.memory_file.write_bytes(b"".join(_dumps_line(n) for n in [*legacy_notes, note]))
+        else:
+            with open(self.memory_file, "ab") as f:
+                f.write(_dumps_line(note))
 
     async def execute(self, content: str, category: str = "general") -> ToolResult:
         """Record a session note.
@@ -99,19 +133,15 @@ class SessionNoteTool(Tool):
             ToolResult with success status
         """
         try:
-            # Load existing notes
-            notes = self._load_from_file()
-
             # Add new note with timestamp
             note = {
                 "timestamp": datetime.now().isoformat(),
                 "category": category,
                 "content": content,
             }
-            notes.append(note)
 
-            # Save back to file
-            self._save_to_file(notes)
+            # Append to file
+            self._append_to_file(note)
 
             return ToolResult(
                 success=True,
@@ -176,7 +206,7 @@ class RecallNoteTool(Tool):
                     content="No notes recorded yet.",
                 )
 
-            notes = json.loads(self.memory_file.read_text())
+            notes = load_notes(self.memory_file)
 
             if not notes:
                 return ToolResult(
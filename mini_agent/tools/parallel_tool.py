@@ -0,0 +1,99 @@
+"""
+Parallel Tool Calls - Run several independent tool calls concurrently
+"""
+
+import asyncio
+from typing import Any
+
+from .base import Tool, ToolResult
+
+
+class ParallelToolCallsTool(Tool):
+    """Meta-tool that executes independent tool calls with asyncio.gather"""
+
+    def __init__(self, tools: list[Tool]):
+        """
+        Initialize Parallel Tool Calls Tool
+
+        Args:
+            tools: Tools that may be dispatched (indexed by name at construction)
+        """
+        self._tools_by_name: dict[str, Tool] = {tool.name: tool for tool in tools}
+
+    @property
+    def name(self) -> str:
+        return "parallel_tool_calls"
+
+    @property
+    def description(self) -> str:
+        tool_list = ", ".join(self._tools_by_name) if self._tools_by_name else "none"
+        return (
+            "Execute multiple independent tool calls concurrently and return all results in order. "
+            "Use this when several lookups do not depend on each other's output. "
+            f"Available tools: {tool_list}"
+        )
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Independent tool calls to run concurrently",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                                "enum": list(self._tools_by_name),
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool call",
+                            },
+                        },
+                        "required": ["name"],
+                    },
+                },
+            },
+            "required": ["calls"],
+        }
+
+    async def _execute_call(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        """Execute a single call, converting failures into a failed ToolResult."""
+        tool = self._tools_by_name.get(name)
+        if tool is None:
+            return ToolResult(success=False, error=f"Unknown tool: {name}")
+        try:
+            return await tool.execute(**arguments)
+        except Exception as e:
+            return ToolResult(success=False, error=f"Tool execution failed: {type(e).__name__}: {str(e)}")
+
+    async def execute(self, calls: list[dict[str, Any]]) -> ToolResult:
+        """
+        Execute tool calls concurrently
+
+        Args:
+            calls: List of {"name": ..., "arguments": {...}} tool calls
+
+        Returns:
+            ToolResult with each call's result (or error), in request order
+        """
+        if not calls:
+            return ToolResult(success=False, error="No tool calls specified")
+
+        results = await asyncio.gather(
+            *(self._execute_call(call.get("name", ""), call.get("arguments") or {}) for call in calls)
+        )
+
+        sections = []
+        for idx, (call, result) in enumerate(zip(calls, results), 1):
+            body = result.content if result.success else f"Error: {result.error}"
+            sections.append(f"[{idx}] {call.get('name', '')}:\n{body}")
+
+        combined = "\n\n".join(sections)
+        if not any(result.success for result in results):
+            return ToolResult(success=False, error=combined)
+        return ToolResult(success=True, content=combined)
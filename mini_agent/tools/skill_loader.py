@@ -11,6 +11,11 @@ from typing import Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 @dataclass
 class Skill:
@@ -63,19 +68,18 @@ class SkillLoader:
         try:
             content = skill_path.read_text(encoding="utf-8")
 
-            # Parse YAML frontmatter
-            frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+            # Split YAML frontmatter from the skill body
+            parts = content[4:].split("\n---\n", 1) if content.startswith("---\n") else []
 
-            if not frontmatter_match:
+            if len(parts) != 2:
                 print(f"⚠️  {skill_path} missing YAML frontmatter")
                 return None
 
-            frontmatter_text = frontmatter_match.group(1)
-            skill_content = frontmatter_match.group(2).strip()
+            frontmatter_text, skill_content = parts[0], parts[1].strip()
 
             # Parse YAML
             try:
-                frontmatter = yaml.safe_load(frontmatter_text)
+                frontmatter = yaml.load(frontmatter_text, Loader=_Loader)
             except yaml.YAMLError as e:
                 print(f"❌ Failed to parse YAML frontmatter: {e}")
                 return None
@@ -9,35 +9,99 @@
 """
 
 import asyncio
+import collections
+import contextlib
+import functools
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# 可选：使用 orjson 加速 JSON 解析与序列化（未安装时回退到标准库 json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 添加项目根目录到 sys.path
 current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# mini_agent 相关模块在使用处按需导入，仅使用 load_alert / format_alert_info 时 import analyzer 保持轻量
+if TYPE_CHECKING:
+    from mini_agent.tools.agent_loader import AgentLoader
+
+# 告警数据的必需字段
+_REQUIRED_FIELDS = frozenset({"attacker_ip", "victim_ip", "attack_type"})
+
+# 主代理分析的墙钟超时（秒），防止卡住的 MCP 调用或失控的工具循环无限阻塞
+ANALYSIS_TIMEOUT = 600
+
+
+def _dumps_indented(value) -> str:
+    """以 2 空格缩进序列化 JSON（保留非 ASCII 字符）"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_agent_loader(agents_dir: str) -> "AgentLoader":
+    """获取子代理加载器（按目录复用，重复分析时跳过未变化文件的解析）"""
+    from mini_agent.tools.agent_loader import AgentLoader
+
+    return AgentLoader(agents_dir=agents_dir)
 
-from mini_agent.agent import Agent
-from mini_agent.config import Config
-from mini_agent.llm import LLMClient
-from mini_agent.tools.agent_loader import AgentLoader
-from mini_agent.tools.call_agent_tool import CallAgentTool
-from mini_agent.tools.note_tool import SessionNoteTool
-from mini_agent.tools.mcp_loader import load_mcp_tools_async, cleanup_mcp_connections
+
+@functools.lru_cache(maxsize=8)
+def _load_main_prompt(path_str: str, mtime_ns: int) -> str:
+    """读取主代理定义并去除 YAML frontmatter（按路径和修改时间缓存）"""
+    from mini_agent.tools.agent_loader import read_text_cached
+
+    main_agent_content = read_text_cached(Path(path_str))
+    # 如果是 YAML frontmatter 格式，提取正文
+    if main_agent_content.startswith('---'):
+        parts = main_agent_content.split('---', 2)
+        if len(parts) >= 3:
+            return parts[2].strip()
+    return main_agent_content
+
+
+@functools.lru_cache(maxsize=1)
+def build_system_prompt(workspace_dir: str, agents_metadata: str, main_prompt: str) -> str:
+    """构建主协调代理的系统提示
+
+    相同输入返回同一字符串，使系统提示前缀在多次分析间逐字节一致，便于服务端前缀缓存命中。
+    """
+    return f"""你是安全告警协调分析专家，负责全面评估安全威胁。
+
+## 当前工作空间
+{workspace_dir}
+
+## 可用的专业子代理
+
+{agents_metadata}
+
+{main_prompt}
+
+当子任务相互独立时（例如威胁情报分析与 TTP 分析），请通过一次 `call_agents_parallel` 调用同时分发给多个子代理，而不是依次调用 `call_agent`。
+
+请分析以下安全告警，调用子代理并生成综合评估报告。
+"""
 
 
 def load_alert(alert_file: Path) -> dict:
     """加载安全告警数据"""
     try:
-        with open(alert_file, 'r', encoding='utf-8') as f:
-            alert = json.load(f)
+        data = alert_file.read_bytes()
+        alert = orjson.loads(data) if orjson is not None else json.loads(data)
         
-        # 验证必需字段
-        required_fields = ["attacker_ip", "victim_ip", "attack_type"]
-        for field in required_fields:
-            if field not in alert:
-                raise ValueError(f"告警数据缺少必需字段: {field}")
+        # 验证必需字段（一次性报告所有缺失字段）
+        missing = _REQUIRED_FIELDS - alert.keys()
+        if missing:
+            raise ValueError(f"告警数据缺少必需字段: {', '.join(sorted(missing))}")
         
         return alert
     except json.JSONDecodeError as e:
@@ -46,27 +110,31 @@ def load_alert(alert_file: Path) -> dict:
         raise ValueError(f"告警文件不存在: {alert_file}")
 
 
+_SEPARATOR = "=" * 80
+
+# 告警详情模板（必需字段由 load_alert 保证存在，可选字段缺失时显示 N/A）
+_ALERT_TEMPLATE = (
+    f"{_SEPARATOR}\n"
+    "安全告警详情\n"
+    f"{_SEPARATOR}\n"
+    "告警 ID: {alert_id}\n"
+    "时间: {timestamp}\n"
+    "攻击者 IP: {attacker_ip}\n"
+    "受害者 IP: {victim_ip}\n"
+    "攻击类型: {attack_type}\n"
+    "载荷: {payload}\n"
+    "协议: {protocol}\n"
+    "目标端口: {destination_port}\n"
+)
+_ALERT_DEFAULTS = dict.fromkeys(("alert_id", "timestamp", "payload", "protocol", "destination_port"), "N/A")
+
+
 def format_alert_info(alert: dict) -> str:
     """格式化告警信息用于显示"""
-    lines = [
-        "=" * 80,
-        "安全告警详情",
-        "=" * 80,
-        f"告警 ID: {alert.get('alert_id', 'N/A')}",
-        f"时间: {alert.get('timestamp', 'N/A')}",
-        f"攻击者 IP: {alert['attacker_ip']}",
-        f"受害者 IP: {alert['victim_ip']}",
-        f"攻击类型: {alert['attack_type']}",
-        f"载荷: {alert.get('payload', 'N/A')}",
-        f"协议: {alert.get('protocol', 'N/A')}",
-        f"目标端口: {alert.get('destination_port', 'N/A')}",
-    ]
-    
+    text = _ALERT_TEMPLATE.format_map(collections.ChainMap(alert, _ALERT_DEFAULTS))
     if 'description' in alert:
-        lines.append(f"描述: {alert['description']}")
-    
-    lines.append("=" * 80)
-    return "\n".join(lines)
+        text += f"描述: {alert['description']}\n"
+    return text + _SEPARATOR
 
 
 async def main():
@@ -75,17 +143,32 @@ async def main():
     print("        安全告警分析系统 (基于 MiniMax M2 模型)")
     print("🛡️  " * 20 + "\n")
     
-    # 确保在退出时清理 MCP 连接
+    from mini_agent.tools.mcp_loader import cleanup_mcp_connections
+
+    # 确保在退出时清理 MCP 连接和 LLM 客户端连接池
+    cleanup = contextlib.AsyncExitStack()
     try:
-        await _run_analysis()
+        await _run_analysis(cleanup)
     finally:
         print("\n🔌 清理 MCP 连接...")
+        await cleanup.aclose()
         await cleanup_mcp_connections()
         print("✅ 清理完成")
 
 
-async def _run_analysis():
-    """实际的分析逻辑"""
+async def _run_analysis(cleanup: contextlib.AsyncExitStack):
+    """实际的分析逻辑
+
+    Args:
+        cleanup: 退出时需要执行的异步清理回调
+    """
+    from mini_agent.agent import Agent
+    from mini_agent.config import Config
+    from mini_agent.llm import LLMClient
+    from mini_agent.tools.call_agent_tool import CallAgentTool, CallAgentsParallelTool, SubAgentResultCache
+    from mini_agent.tools.mcp_loader import load_mcp_tools_async
+    from mini_agent.tools.note_tool import SessionNoteTool
+    from mini_agent.tools.parallel_tool import ParallelToolCallsTool
     
     # 解析命令行参数
     if len(sys.argv) < 2:
@@ -148,8 +231,9 @@ async def _run_analysis():
     llm_client = LLMClient(
         api_key=config.llm.api_key,
         api_base=config.llm.api_base,
-        model=config.llm.model
+        model=config.llm.model,
     )
+    cleanup.push_async_callback(llm_client.aclose)
     
     # 基础工具
     tools = [
@@ -178,8 +262,24 @@ async def _run_analysis():
     
     print(f"✅ 使用配置文件: {mcp_config_path}")
     
+    # 主代理的定义文件（必需）
+    main_agent_path = current_dir / "main.md"
+    if not main_agent_path.exists():
+        print(f"❌ 错误: 未找到主代理定义文件: {main_agent_path}")
+        print("\n主协调代理必须有明确的 MD 描述文件来指导如何整合子代理输出")
+        print("请确保 agents/main-coordinator-agent.md 文件存在")
+        sys.exit(1)
+    
+    # MCP 连接（网络）与子代理发现、主代理定义读取（本地文件）相互独立，并发启动
+    agent_loader = _get_agent_loader(str(agents_dir))
+    mcp_task = asyncio.create_task(load_mcp_tools_async(config_path=str(mcp_config_path)))
+    discover_task = asyncio.create_task(asyncio.to_thread(agent_loader.discover_agents))
+    main_prompt_task = asyncio.create_task(
+        asyncio.to_thread(lambda: _load_main_prompt(str(main_agent_path), main_agent_path.stat().st_mtime_ns))
+    )
+    
     try:
-        mcp_tools = await load_mcp_tools_async(config_path=str(mcp_config_path))
+        mcp_tools = await mcp_task
         if mcp_tools:
             tools.extend(mcp_tools)
             print(f"✅ 已加载 {len(mcp_tools)} 个 MCP 工具")
@@ -195,10 +295,12 @@ async def _run_analysis():
         traceback.print_exc()
         sys.exit(1)
     
+    # 并行执行相互独立的 MCP 工具调用（子代理也可使用）
+    tools.append(ParallelToolCallsTool(tools=mcp_tools))
+    
     # 加载子代理
     print("\n🤖 加载子代理...")
-    agent_loader = AgentLoader(agents_dir=str(agents_dir))
-    discovered = agent_loader.discover_agents()
+    discovered = await discover_task
     
     if not discovered:
         print(f"❌ 错误: 未找到子代理定义文件 (目录: {agents_dir})")
@@ -208,59 +310,46 @@ async def _run_analysis():
     for agent_def in discovered:
         print(f"   • {agent_def.name}: {agent_def.description}")
     
-    # 添加 CallAgentTool
+    # 添加 CallAgentTool（与并行调用工具共享子代理结果缓存）
+    sub_agent_results = SubAgentResultCache()
     call_agent_tool = CallAgentTool(
         agent_loader=agent_loader,
         llm_client=llm_client,
         all_tools=tools,
         workspace_dir=str(workspace_dir),
         call_depth=0,
-        max_depth=1
+        max_depth=1,
+        result_cache=sub_agent_results,
+    )
+    # 并行调用多个相互独立的子代理
+    call_agents_parallel_tool = CallAgentsParallelTool(
+        agent_loader=agent_loader,
+        llm_client=llm_client,
+        all_tools=tools,
+        workspace_dir=str(workspace_dir),
+        call_depth=0,
+        max_depth=1,
+        result_cache=sub_agent_results,
     )
     tools.append(call_agent_tool)
+    tools.append(call_agents_parallel_tool)
     
     # 初始化主协调代理
     print("\n🎯 初始化主协调代理...")
     
-    # 加载主代理的定义文件（必需）
-    main_agent_path = current_dir / "main.md"
-    if not main_agent_path.exists():
-        print(f"❌ 错误: 未找到主代理定义文件: {main_agent_path}")
-        print("\n主协调代理必须有明确的 MD 描述文件来指导如何整合子代理输出")
-        print("请确保 agents/main-coordinator-agent.md 文件存在")
-        sys.exit(1)
-    
     # 读取并解析主代理定义
     try:
-        main_agent_content = main_agent_path.read_text(encoding='utf-8')
-        # 如果是 YAML frontmatter 格式，提取正文
-        if main_agent_content.startswith('---'):
-            parts = main_agent_content.split('---', 2)
-            if len(parts) >= 3:
-                main_agent_prompt = parts[2].strip()
-            else:
-                main_agent_prompt = main_agent_content
-        else:
-            main_agent_prompt = main_agent_content
+        main_agent_prompt = await main_prompt_task
         print(f"✅ 已加载主代理定义: {main_agent_path.name}")
     except Exception as e:
         print(f"❌ 错误: 读取主代理定义文件失败: {e}")
         sys.exit(1)
     
-    # 创建主协调代理的系统提示
-    system_prompt = f"""你是安全告警协调分析专家，负责全面评估安全威胁。
-
-## 当前工作空间
-{workspace_dir}
-
-## 可用的专业子代理
+    # 子代理元数据由 AgentLoader 缓存，未变化时直接复用
+    agents_metadata = agent_loader.get_agents_metadata_prompt()
 
-{agent_loader.get_agents_metadata_prompt()}
-
-{main_agent_prompt}
-
-请分析以下安全告警，调用子代理并生成综合评估报告。
-"""
+    # 创建主协调代理的系统提示（告警数据只放在用户消息中，系统提示在多次分析间保持一致）
+    system_prompt = build_system_prompt(str(workspace_dir), agents_metadata, main_agent_prompt)
     
     # 创建主代理
     main_agent = Agent(
@@ -286,7 +375,7 @@ async def _run_analysis():
 """
     
     if 'additional_context' in alert:
-        user_message += f"\n**额外上下文**\n{json.dumps(alert['additional_context'], indent=2, ensure_ascii=False)}"
+        user_message += f"\n**额外上下文**\n{_dumps_indented(alert['additional_context'])}"
     
     main_agent.add_user_message(user_message)
     
@@ -296,7 +385,7 @@ async def _run_analysis():
     print("=" * 80 + "\n")
     
     try:
-        result = await main_agent.run()
+        result = await asyncio.wait_for(main_agent.run(), timeout=ANALYSIS_TIMEOUT)
         
         print("\n" + "=" * 80)
         print("📊 分析完成")
@@ -305,6 +394,9 @@ async def _run_analysis():
         print(result)
         print("\n" + "=" * 80)
         
+    except asyncio.TimeoutError:
+        print(f"\n❌ 分析超时（超过 {ANALYSIS_TIMEOUT} 秒），已终止")
+        sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n⚠️  分析被用户中断")
         sys.exit(1)
@@ -315,5 +407,15 @@ async def _run_analysis():
         sys.exit(1)
 
 
+def _install_event_loop_policy():
+    """可选：使用 uvloop 事件循环（未安装时保留默认 asyncio 事件循环）"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_event_loop_policy()
     asyncio.run(main())
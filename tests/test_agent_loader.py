@@ -1,11 +1,12 @@
 """Tests for AgentLoader"""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from mini_agent.tools.agent_loader import AgentDefinition, AgentLoader
+from mini_agent.tools.agent_loader import AgentDefinition, AgentLoader, read_text_cached
 
 
 @pytest.fixture
@@ -89,6 +90,119 @@ def test_load_agent_missing_frontmatter(temp_agents_dir):
     assert agent is None
 
 
+def test_load_agent_body_with_separator(temp_agents_dir):
+    """Test that only the first closing delimiter ends the frontmatter"""
+    agent_file = temp_agents_dir / "separator.md"
+    agent_file.write_text(
+        """---
+name: separator_agent
+description: Body contains a horizontal rule
+---
+Intro
+
+---
+
+Outro
+""",
+        encoding="utf-8",
+    )
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    agent = loader.load_agent(agent_file)
+
+    assert agent is not None
+    assert agent.name == "separator_agent"
+    assert agent.prompt == "Intro\n\n---\n\nOutro"
+
+
+def test_load_agent_prompt_loaded_lazily(temp_agents_dir):
+    """Test that the prompt body is read on first access, not during discovery"""
+    long_description = "x" * 5000  # Frontmatter spans more than one read chunk
+    agent_file = temp_agents_dir / "lazy.md"
+    agent_file.write_text(
+        f"""---
+name: lazy_agent
+description: {long_description}
+---
+Lazy prompt body
+""",
+        encoding="utf-8",
+    )
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    loader.discover_agents()
+    agent = loader.get_agent("lazy_agent")
+
+    assert agent.description == long_description
+    assert "lazy_agent" in loader.get_agents_metadata_prompt()
+    assert agent._prompt is None
+    assert agent.prompt == "Lazy prompt body"
+
+
+def test_load_agent_prompt_after_file_edit(temp_agents_dir):
+    """Test that the lazy prompt is located again when the file changes after discovery"""
+    agent_file = temp_agents_dir / "edited.md"
+    agent_file.write_text("---\nname: agent_a\ndescription: Short\n---\nYou are agent A.\n", encoding="utf-8")
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    loader.discover_agents()
+    agent = loader.get_agent("agent_a")
+
+    stat = agent_file.stat()
+    agent_file.write_text(
+        "---\nname: agent_a\ndescription: A much longer description now\n---\nYou are agent A.\n",
+        encoding="utf-8",
+    )
+    os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert agent.prompt == "You are agent A."
+
+
+def test_load_agent_large_prompt(temp_agents_dir):
+    """Test lazily loading a prompt body large enough to be memory-mapped"""
+    body = "Large prompt line ✓\n" * 10000
+    agent_file = temp_agents_dir / "large.md"
+    agent_file.write_text(
+        f"---\nname: large_agent\ndescription: Large prompt\n---\n{body}",
+        encoding="utf-8",
+    )
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    agent = loader.load_agent(agent_file)
+
+    assert agent.prompt == body.strip()
+
+
+def test_read_text_cached(temp_agents_dir):
+    """Test cached reads pick up file changes"""
+    text_file = temp_agents_dir / "notes.txt"
+    text_file.write_text("first", encoding="utf-8")
+
+    assert read_text_cached(text_file) == "first"
+    assert read_text_cached(text_file, offset=2) == "rst"
+
+    text_file.write_text("second version", encoding="utf-8")
+    assert read_text_cached(text_file) == "second version"
+
+
+def test_load_agent_quoted_keys(temp_agents_dir):
+    """Test that frontmatter with quoted keys or spaced colons still loads"""
+    quoted_file = temp_agents_dir / "quoted.md"
+    quoted_file.write_text("---\n'name': quoted_agent\n\"description\": Quoted keys\n---\nQuoted\n", encoding="utf-8")
+    spaced_file = temp_agents_dir / "spaced.md"
+    spaced_file.write_text("---\nname : spaced_agent\ndescription : Spaced colons\n---\nSpaced\n", encoding="utf-8")
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+
+    quoted = loader.load_agent(quoted_file)
+    spaced = loader.load_agent(spaced_file)
+
+    assert quoted is not None and quoted.name == "quoted_agent"
+    assert quoted.description == "Quoted keys"
+    assert spaced is not None and spaced.name == "spaced_agent"
+    assert spaced.prompt == "Spaced"
+
+
 def test_load_agent_missing_required_fields(temp_agents_dir):
     """Test loading agent with missing required fields"""
     bad_file = temp_agents_dir / "incomplete.md"
@@ -118,6 +232,48 @@ def test_discover_agents(sample_agent_file, minimal_agent_file, temp_agents_dir)
     assert "minimal_agent" in agent_names
 
 
+def test_discover_many_agents(temp_agents_dir):
+    """Test discovering enough agents to use the parallel loading path"""
+    for i in range(10):
+        (temp_agents_dir / f"agent_{i}.md").write_text(
+            f"---\nname: agent_{i}\ndescription: Agent number {i}\n---\nPrompt {i}\n",
+            encoding="utf-8",
+        )
+    (temp_agents_dir / "broken.md").write_text("No frontmatter here!", encoding="utf-8")
+
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    agents = loader.discover_agents()
+
+    assert len(agents) == 10
+    assert [agent.name for agent in agents] == sorted(f"agent_{i}" for i in range(10))
+    assert loader.list_agents() == sorted(f"agent_{i}" for i in range(10))
+    assert loader.get_agent("agent_3").prompt == "Prompt 3"
+
+
+def test_discover_agents_cached(sample_agent_file, temp_agents_dir):
+    """Test that unchanged files are not re-parsed on repeated discovery"""
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    first = loader.discover_agents()
+    second = loader.discover_agents()
+
+    assert first[0] is second[0]
+
+    # Touching the file with a new mtime forces a re-parse
+    stat = sample_agent_file.stat()
+    os.utime(sample_agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = loader.discover_agents()
+
+    assert third[0] is not first[0]
+    assert third[0].name == "test_agent"
+
+
+def test_load_agent_cached(sample_agent_file, temp_agents_dir):
+    """Test that load_agent reuses the parsed definition for an unchanged file"""
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+
+    assert loader.load_agent(sample_agent_file) is loader.load_agent(sample_agent_file)
+
+
 def test_discover_agents_empty_dir(temp_agents_dir):
     """Test discovering agents in empty directory"""
     loader = AgentLoader(agents_dir=str(temp_agents_dir))
@@ -171,6 +327,23 @@ def test_agent_metadata_prompt(sample_agent_file, temp_agents_dir):
     assert "call_agent" in metadata
 
 
+def test_agent_metadata_prompt_cached(sample_agent_file, temp_agents_dir):
+    """Test that the metadata prompt is reused until the agent set changes"""
+    loader = AgentLoader(agents_dir=str(temp_agents_dir))
+    loader.discover_agents()
+
+    first = loader.get_agents_metadata_prompt()
+    loader.discover_agents()
+    assert loader.get_agents_metadata_prompt() is first
+
+    (temp_agents_dir / "extra.md").write_text(
+        "---\nname: extra_agent\ndescription: Added later\n---\nPrompt\n",
+        encoding="utf-8",
+    )
+    loader.discover_agents()
+    assert "extra_agent" in loader.get_agents_metadata_prompt()
+
+
 def test_agent_to_metadata(sample_agent_file, temp_agents_dir):
     """Test AgentDefinition.to_metadata()"""
     loader = AgentLoader(agents_dir=str(temp_agents_dir))
@@ -1,5 +1,6 @@
 """Tests for CallAgentTool"""
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -8,7 +9,7 @@ import pytest
 
 from mini_agent.tools.agent_loader import AgentDefinition, AgentLoader
 from mini_agent.tools.base import Tool, ToolResult
-from mini_agent.tools.call_agent_tool import CallAgentTool
+from mini_agent.tools.call_agent_tool import CallAgentTool, CallAgentsParallelTool, SubAgentResultCache
 
 
 class MockTool(Tool):
@@ -149,6 +150,26 @@ def test_filter_tools_restricted(sample_agent, mock_llm_client, mock_tools, temp
     assert "call_agent" not in tool_names
 
 
+def test_filter_tools_reuses_note_tool(sample_agent, mock_llm_client, mock_tools, temp_agents_dir):
+    """Test that each sub-agent gets one isolated note tool reused across calls"""
+    agent_def = AgentDefinition(name="notes", description="Notes agent", prompt="Test")
+
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+    )
+
+    first = [t for t in tool._filter_tools(agent_def, "notes") if t.name == "record_note"]
+    second = [t for t in tool._filter_tools(agent_def, "notes") if t.name == "record_note"]
+    other = [t for t in tool._filter_tools(agent_def, "other") if t.name == "record_note"]
+
+    assert first[0] is second[0]
+    assert first[0] is not other[0]
+    assert first[0] not in mock_tools
+
+
 def test_prepare_agent_prompt(sample_agent, mock_llm_client, mock_tools, temp_agents_dir):
     """Test task injection into agent prompt"""
     tool = CallAgentTool(
@@ -216,3 +237,224 @@ def test_parameters_schema(sample_agent, mock_llm_client, mock_tools, temp_agent
     assert "agent_name" in params["properties"]
     assert "task" in params["properties"]
     assert params["properties"]["agent_name"]["enum"] == ["test_agent"]
+
+
+def test_parameters_schema_cached(sample_agent, mock_llm_client, mock_tools, temp_agents_dir):
+    """Test that schema and description are rebuilt only when agents change"""
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+    )
+
+    params = tool.parameters
+    assert tool.parameters is params
+    assert tool.description is tool.description
+
+    (temp_agents_dir / "other.md").write_text(
+        "---\nname: other_agent\ndescription: Another agent\n---\nPrompt\n",
+        encoding="utf-8",
+    )
+    sample_agent.discover_agents()
+
+    assert tool.parameters is not params
+    assert "other_agent" in tool.parameters["properties"]["agent_name"]["enum"]
+    assert "other_agent" in tool.description
+
+
+@pytest.mark.asyncio
+async def test_call_agents_parallel(sample_agent, mock_llm_client, mock_tools, temp_agents_dir, monkeypatch):
+    """Test that independent sub-agent calls run concurrently and keep request order"""
+    running = 0
+    max_running = 0
+
+    async def fake_execute(self, agent_name, task):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        if agent_name == "broken":
+            return ToolResult(success=False, error="not found")
+        return ToolResult(success=True, content=f"{agent_name} did {task}")
+
+    monkeypatch.setattr(CallAgentTool, "execute", fake_execute)
+
+    tool = CallAgentsParallelTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+    )
+
+    result = await tool.execute(
+        specs=[
+            {"agent_name": "test_agent", "task": "first"},
+            {"agent_name": "broken", "task": "second"},
+        ]
+    )
+
+    assert tool.name == "call_agents_parallel"
+    assert max_running == 2
+    assert result.success is True
+    assert result.content.index("test_agent did first") < result.content.index("Error: not found")
+
+
+def test_filter_tools_excludes_parallel_tool(sample_agent, mock_llm_client, mock_tools, temp_agents_dir):
+    """Test that sub-agents never receive the parallel agent-calling tool"""
+    parallel_tool = CallAgentsParallelTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+    )
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools + [parallel_tool],
+        workspace_dir=str(temp_agents_dir),
+    )
+
+    agent_def = AgentDefinition(name="unrestricted", description="No restrictions", prompt="Test")
+    tool_names = {t.name for t in tool._filter_tools(agent_def, "unrestricted")}
+
+    assert "call_agents_parallel" not in tool_names
+
+
+@pytest.mark.asyncio
+async def test_execute_reuses_cached_result(sample_agent, mock_llm_client, mock_tools, temp_agents_dir, monkeypatch):
+    """Test that repeated identical calls reuse the result unless [[fresh]] is given"""
+    from mini_agent.agent import Agent
+    from mini_agent.schema import Message
+
+    tasks = []
+
+    async def fake_run(self):
+        tasks.append(self.messages[-1].content)
+        answer = f"answer {len(tasks)}"
+        self.messages.append(Message(role="assistant", content=answer))
+        return answer
+
+    monkeypatch.setattr(Agent, "run", fake_run)
+
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+        result_cache=SubAgentResultCache(),
+    )
+
+    first = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+    repeat = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+    fresh = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4 [[fresh]]")
+    after_fresh = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+
+    assert tasks == ["Analyze 1.2.3.4", "Analyze 1.2.3.4"]
+    assert "answer 1" in first.content
+    assert repeat.content == "[cached] " + first.content
+    assert "answer 2" in fresh.content and not fresh.content.startswith("[cached]")
+    assert after_fresh.content == "[cached] " + fresh.content
+
+
+@pytest.mark.asyncio
+async def test_execute_does_not_cache_failed_run(sample_agent, mock_tools, temp_agents_dir):
+    """Test that a sub-agent run whose LLM call failed is retried instead of served from cache"""
+    from mini_agent.schema import LLMResponse
+
+    llm_client = MagicMock()
+    llm_client.generate = AsyncMock(
+        side_effect=[
+            Exception("503 Service Unavailable"),
+            LLMResponse(content="recovered", finish_reason="end_turn"),
+        ]
+    )
+
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+        result_cache=SubAgentResultCache(),
+    )
+
+    failed = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+    retried = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+    repeat = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+
+    assert "LLM call failed" in failed.content
+    assert llm_client.generate.await_count == 2
+    assert not retried.content.startswith("[cached]")
+    assert "recovered" in retried.content
+    assert repeat.content == "[cached] " + retried.content
+
+
+@pytest.mark.asyncio
+async def test_result_cache_shared_between_tools(sample_agent, mock_llm_client, mock_tools, temp_agents_dir, monkeypatch):
+    """Test that call_agent reuses a result produced through call_agents_parallel when they share a cache"""
+    from mini_agent.agent import Agent
+    from mini_agent.schema import Message
+
+    runs = 0
+
+    async def fake_run(self):
+        nonlocal runs
+        runs += 1
+        self.messages.append(Message(role="assistant", content="done"))
+        return "done"
+
+    monkeypatch.setattr(Agent, "run", fake_run)
+
+    result_cache = SubAgentResultCache()
+    parallel_tool = CallAgentsParallelTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+        result_cache=result_cache,
+    )
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+        result_cache=result_cache,
+    )
+
+    await parallel_tool.execute(specs=[{"agent_name": "test_agent", "task": "Analyze 1.2.3.4"}])
+    result = await tool.execute(agent_name="test_agent", task="Analyze 1.2.3.4")
+
+    assert runs == 1
+    assert result.content.startswith("[cached]")
+
+
+@pytest.mark.asyncio
+async def test_execute_without_result_cache(sample_agent, mock_llm_client, mock_tools, temp_agents_dir, monkeypatch):
+    """Test that sub-agent results are not cached unless a cache is configured"""
+    from mini_agent.agent import Agent
+    from mini_agent.schema import Message
+
+    runs = 0
+
+    async def fake_run(self):
+        nonlocal runs
+        runs += 1
+        self.messages.append(Message(role="assistant", content="done"))
+        return "done"
+
+    monkeypatch.setattr(Agent, "run", fake_run)
+
+    tool = CallAgentTool(
+        agent_loader=sample_agent,
+        llm_client=mock_llm_client,
+        all_tools=mock_tools,
+        workspace_dir=str(temp_agents_dir),
+    )
+
+    first = await tool.execute(agent_name="test_agent", task="Run the tests")
+    second = await tool.execute(agent_name="test_agent", task="Run the tests")
+
+    assert runs == 2
+    assert first.content == second.content
+    assert "[[fresh]]" not in tool.parameters["properties"]["task"]["description"]
@@ -130,6 +130,21 @@ async def test_tool_calling():
         return False
 
 
+@pytest.mark.asyncio
+async def test_http_client_reused():
+    """Test that the HTTP client is shared across requests and released on aclose."""
+    client = LLMClient(api_key="test-key")
+
+    http_client = client._get_client()
+    assert client._get_client() is http_client
+
+    await client.aclose()
+    assert http_client.is_closed
+    assert client._client is None
+    assert client._get_client() is not http_client
+    await client.aclose()
+
+
 async def main():
     """Run all LLM tests."""
     print("=" * 80)
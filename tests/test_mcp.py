@@ -6,7 +6,11 @@ from pathlib import Path
 
 import pytest
 
-from mini_agent.tools.mcp_loader import cleanup_mcp_connections, load_mcp_tools_async
+from mini_agent.tools.mcp_loader import (
+    MCPServerConnection,
+    cleanup_mcp_connections,
+    load_mcp_tools_async,
+)
 
 
 @pytest.fixture(scope="module")
@@ -175,6 +179,48 @@ async def test_mcp_tool_execution():
         await cleanup_mcp_connections()
 
 
+@pytest.mark.asyncio
+async def test_mcp_servers_connect_concurrently(tmp_path, monkeypatch):
+    """Test that MCP servers are connected concurrently and tools keep config order."""
+    config_file = tmp_path / "mcp.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "slow": {"command": "slow-server"},
+                    "broken": {"command": "broken-server"},
+                    "fast": {"command": "fast-server"},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    running = 0
+    max_running = 0
+
+    async def fake_connect(self):
+        nonlocal running, max_running
+        if self.name == "broken":
+            raise RuntimeError("boom")
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05 if self.name == "slow" else 0.01)
+        running -= 1
+        self.tools = [self.name]
+        return True
+
+    monkeypatch.setattr(MCPServerConnection, "connect", fake_connect)
+
+    try:
+        tools = await load_mcp_tools_async(str(config_file))
+
+        assert tools == ["slow", "fast"]
+        assert max_running == 2
+    finally:
+        await cleanup_mcp_connections()
+
+
 async def main():
     """Run all MCP tests."""
     print("=" * 80)
@@ -1,11 +1,12 @@
 """Test cases for Session Note Tool."""
 
+import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from mini_agent.tools.note_tool import SessionNoteTool, RecallNoteTool
+from mini_agent.tools.note_tool import SessionNoteTool, RecallNoteTool, load_notes
 
 
 @pytest.mark.asyncio
@@ -113,6 +114,31 @@ async def test_note_persistence():
         Path(note_file).unlink(missing_ok=True)
 
 
+@pytest.mark.asyncio
+async def test_notes_append_jsonl_and_legacy_format():
+    """Test that notes are appended as JSON lines and legacy JSON arrays are migrated."""
+    print("\n=== Testing Note File Format ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        note_file = Path(tmp_dir) / ".agent_memory.json"
+        note_file.write_text(json.dumps([{"timestamp": "t0", "category": "old", "content": "Legacy note"}]))
+
+        record_tool = SessionNoteTool(memory_file=str(note_file))
+        assert (await record_tool.execute(content="First", category="a")).success
+        assert (await record_tool.execute(content="Second", category="b")).success
+
+        lines = note_file.read_text().splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line)["content"] for line in lines] == ["Legacy note", "First", "Second"]
+        assert [note["content"] for note in load_notes(note_file)] == ["Legacy note", "First", "Second"]
+
+        result = await RecallNoteTool(memory_file=str(note_file)).execute(category="old")
+        assert "Legacy note" in result.content
+        assert "Second" not in result.content
+
+        print("✅ Note file format test passed")
+
+
 async def main():
     """Run all session note tool tests."""
     print("=" * 80)
@@ -122,6 +148,7 @@ async def main():
     await test_record_and_recall_notes()
     await test_empty_notes()
     await test_note_persistence()
+    await test_notes_append_jsonl_and_legacy_format()
 
     print("\n" + "=" * 80)
     print("All Session Note Tool tests passed! ✅")
@@ -0,0 +1,84 @@
+"""Tests for ParallelToolCallsTool"""
+
+import asyncio
+
+import pytest
+
+from mini_agent.tools.base import Tool, ToolResult
+from mini_agent.tools.parallel_tool import ParallelToolCallsTool
+
+
+class SlowTool(Tool):
+    """Mock tool that sleeps before echoing its arguments"""
+
+    def __init__(self, tool_name: str, delay: float = 0.1):
+        self._name = tool_name
+        self._delay = delay
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return f"Slow {self._name}"
+
+    @property
+    def parameters(self) -> dict:
+        return {"type": "object", "properties": {"ip": {"type": "string"}}}
+
+    async def execute(self, ip: str) -> ToolResult:
+        await asyncio.sleep(self._delay)
+        return ToolResult(success=True, content=f"{self._name}({ip})")
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_concurrent():
+    """Test that independent calls overlap and results keep request order"""
+    tool = ParallelToolCallsTool(tools=[SlowTool("query_ip_reputation", 0.2), SlowTool("get_asset_profile", 0.2)])
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await tool.execute(
+        calls=[
+            {"name": "query_ip_reputation", "arguments": {"ip": "192.0.2.1"}},
+            {"name": "get_asset_profile", "arguments": {"ip": "10.0.0.1"}},
+        ]
+    )
+    elapsed = loop.time() - start
+
+    assert result.success is True
+    assert elapsed < 0.35
+    assert result.content.index("query_ip_reputation(192.0.2.1)") < result.content.index("get_asset_profile(10.0.0.1)")
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_errors():
+    """Test unknown tools and bad arguments are reported per call"""
+    tool = ParallelToolCallsTool(tools=[SlowTool("query_ip_reputation", 0)])
+
+    result = await tool.execute(
+        calls=[
+            {"name": "query_ip_reputation", "arguments": {"ip": "192.0.2.1"}},
+            {"name": "call_agent", "arguments": {}},
+            {"name": "query_ip_reputation", "arguments": {"wrong": "x"}},
+        ]
+    )
+
+    assert result.success is True
+    assert "Unknown tool: call_agent" in result.content
+    assert "TypeError" in result.content
+
+    failed = await tool.execute(calls=[{"name": "missing"}])
+    assert failed.success is False
+    assert "Unknown tool: missing" in failed.error
+
+
+def test_parallel_tool_calls_schema():
+    """Test that the schema lists the dispatchable tools"""
+    tool = ParallelToolCallsTool(tools=[SlowTool("query_ip_reputation"), SlowTool("get_asset_profile")])
+
+    items = tool.parameters["properties"]["calls"]["items"]
+
+    assert tool.name == "parallel_tool_calls"
+    assert items["properties"]["name"]["enum"] == ["query_ip_reputation", "get_asset_profile"]